@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+from vocal_vse.core import file_manager
+
+
+class TestFileManager(unittest.TestCase):
+
+    def test_content_hash_stable(self):
+        h = file_manager.content_hash("Hello world", "pyttsx3:en")
+        self.assertEqual(h, file_manager.content_hash("Hello world", "pyttsx3:en"))
+        self.assertEqual(len(h), 16)
+        self.assertRegex(h, r"\A[0-9a-f]{16}\Z")
+
+    def test_content_hash_depends_on_text_and_voice(self):
+        h = file_manager.content_hash("Hello world", "pyttsx3:en")
+        self.assertNotEqual(h, file_manager.content_hash("Hello world!", "pyttsx3:en"))
+        self.assertNotEqual(h, file_manager.content_hash("Hello world", "gtts:en"))
+
+    def test_has_audio_header_threshold(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "voc_abc_0123456789abcdef.wav")
+            self.assertFalse(file_manager.has_audio(path))
+            with open(path, "wb") as f:
+                f.write(b"\0" * 44)
+            self.assertFalse(file_manager.has_audio(path))
+            with open(path, "ab") as f:
+                f.write(b"\0")
+            self.assertTrue(file_manager.has_audio(path))
+
+    def test_generated_filename_parses_back(self):
+        strip = {}
+        digest = file_manager.content_hash("Hello", "voice")
+        path = file_manager.generate_audio_filename("out", strip, digest)
+        self.assertEqual(os.path.dirname(path), "out")
+        self.assertEqual(
+            file_manager.parse_narration_filename(os.path.basename(path)),
+            strip[file_manager.ID_PROP],
+        )
+
+    def test_parse_narration_filename_accepts(self):
+        parse = file_manager.parse_narration_filename
+        self.assertEqual(parse("voc_abc_0123456789abcdef.wav"), "abc")
+        self.assertEqual(parse("voc_a2z7_ff.wav"), "a2z7")
+
+    def test_parse_narration_filename_rejects(self):
+        parse = file_manager.parse_narration_filename
+        for name in (
+            "voc_abc_0123456789abcdef.mp3",
+            "voc_abc_0123456789abcdef.wav.tmp",
+            "Voc_abc_0123456789abcdef.wav",
+            "voc_ABC_0123456789abcdef.wav",
+            "voc_ab1_0123456789abcdef.wav",
+            "voc_abc_0123456789ABCDEF.wav",
+            "voc_abc_.wav",
+            "voc__0123456789abcdef.wav",
+            "voc_abc.wav",
+            "xvoc_abc_0123456789abcdef.wav",
+            "narration.wav",
+        ):
+            with self.subTest(name=name):
+                self.assertIsNone(parse(name))
+
+    def test_files_by_tts_id_in_generation_order(self):
+        with tempfile.TemporaryDirectory() as d:
+            # Hash order is the reverse of generation order here
+            names = ["voc_abc_ff.wav", "voc_abc_aa.wav", "voc_xyz_00.wav"]
+            for n, name in enumerate(names):
+                path = os.path.join(d, name)
+                open(path, "wb").close()
+                os.utime(path, ns=(n * 10**9, n * 10**9))
+            open(os.path.join(d, "notes.txt"), "wb").close()
+            index = file_manager.get_files_by_tts_id(d)
+            self.assertEqual(
+                index,
+                {
+                    "abc": ["voc_abc_ff.wav", "voc_abc_aa.wav"],
+                    "xyz": ["voc_xyz_00.wav"],
+                },
+            )
+        self.assertEqual(file_manager.get_files_by_tts_id(d), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
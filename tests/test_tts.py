@@ -1,8 +1,12 @@
 import os
 from pathlib import Path
 import tempfile
+import threading
+import time
 import unittest
 
+from vocal_vse.tts import SynthesizerBase
+
 tmp = Path(tempfile.gettempdir())
 
 
@@ -11,11 +15,6 @@ class TestTTS(unittest.TestCase):
     def test_pyttsx3_synthesize(self):
         from vocal_vse.tts.pyttsx3 import Synthesizer
 
-        # voices = Synthesizer().engine.getProperty("voices")
-        # for voice in voices:
-        #     print(
-        #         f"ID: {voice.id}, Name: {voice.name}, Gender: {voice.gender}, Languages: {voice.languages}"
-        #     )
         f = str(tmp / "voc1_jb1wu1.wav")
         Synthesizer().synthesize(
             r"""Beautiful is better than ugly.
@@ -27,7 +26,8 @@ class TestTTS(unittest.TestCase):
                 Readability counts.""",
             f,
         )
-        self.assertTrue(os.path.exists(f))
+        st = os.stat(f)
+        self.assertGreater(st.st_size, 44, "WAV file too small to contain audio")
 
     def test_cmd_synthesize_gtts(self):
         from vocal_vse.tts.cmd import Synthesizer
@@ -36,16 +36,24 @@ class TestTTS(unittest.TestCase):
             "gtts-cli", ["--lang", "fr", "--output", "{output_path}", "-"]
         )
         self.assertTrue(synt.is_available())
-        print(synt.shutil.which(synt.bin))
         synt.synthesize("Bonjour le monde", str(tmp / "gtts-cli-fr.wav"))
 
+    def test_cmd_synthesize_to_stream_gtts(self):
+        from vocal_vse.tts.cmd import Synthesizer
+
+        synt = Synthesizer(
+            "gtts-cli", ["--lang", "en", "--output", "{output_path}", "-"]
+        )
+        self.assertTrue(synt.is_available())
+        data = synt.synthesize_to_stream("Hello world")
+        self.assertGreater(len(data), 44)
+
     def test_cmd_synthesize_espeak(self):
         from vocal_vse.tts.cmd import Synthesizer
 
         synt = Synthesizer(
             "espeak-ng", ["-v", "ja", "-w", "{output_path}", "-b", "1", "--stdin"]
         )
-        print(synt.shutil.which(synt.bin))
         self.assertTrue(synt.is_available())
         synt.synthesize("こんにちは ", str(tmp / "espeak-ja.wav"))
 
@@ -71,7 +79,6 @@ class TestTTS(unittest.TestCase):
         # --lang <str>        Set language (default: en-us)
         # --voice <str>       Set voice or blend voices (default: interactive selection)
 
-        print(synt.shutil.which(synt.bin))
         self.assertTrue(synt.is_available())
         synt.synthesize(
             "Kokoro is an open-weight TTS model with 82 million parameters.",
@@ -81,7 +88,6 @@ class TestTTS(unittest.TestCase):
     def test_synthesize_1(self):
         from vocal_vse.core import config
 
-        print(config.__dict__)
         voices_path = tmp / "test_voices.toml"
         with voices_path.open("w") as w:
             w.write(
@@ -100,7 +106,6 @@ params = { bin = "gtts-cli", args = ["--lang", "es", "--output", "{output_path}"
             voices = config.voices
             self.assertEqual(voices[profile]["name"], "gTTS CLI (Spanish)")
             voc = config.get_voice(profile)
-            print(voc)
             voc.synthesize(
                 "El rápido desarrollo de la tecnología está transformando nuestra vida diaria.",
                 str(tmp / f"{profile}.wav"),
@@ -108,5 +113,58 @@ params = { bin = "gtts-cli", args = ["--lang", "es", "--output", "{output_path}"
         pass
 
 
+class _StubSynthesizer(SynthesizerBase):
+    """Runs a plain function in place of an engine."""
+
+    def __init__(self, max_concurrency, func):
+        self.max_concurrency = max_concurrency
+        self.func = func
+
+    def synthesize(self, text, output_path, **kwargs):
+        self.func(text, output_path)
+
+    def is_available(self):
+        return True
+
+
+class TestSynthesizeBatch(unittest.TestCase):
+
+    def test_results_in_input_order(self):
+        def synthesize(text, output_path):
+            # Later items finish first
+            time.sleep(0.01 * (4 - int(text)))
+            if text in ("1", "3"):
+                raise ValueError(text)
+
+        synt = _StubSynthesizer(4, synthesize)
+        items = [(str(i), f"out{i}.wav") for i in range(5)]
+        results = list(synt.synthesize_batch(items))
+        self.assertEqual([i for i, _ in results], [0, 1, 2, 3, 4])
+        for i, error in results:
+            if i in (1, 3):
+                self.assertIsInstance(error, ValueError)
+                self.assertEqual(str(error), str(i))
+            else:
+                self.assertIsNone(error)
+
+    def test_close_cancels_remaining(self):
+        started = []
+        gate = threading.Event()
+
+        def synthesize(text, output_path):
+            started.append(text)
+            if text != "0":
+                gate.wait(5)
+
+        synt = _StubSynthesizer(2, synthesize)
+        items = [(str(i), f"out{i}.wav") for i in range(10)]
+        batch = synt.synthesize_batch(items)
+        self.assertEqual(next(batch), (0, None))
+        # close() waits for the running items, so let them finish shortly after
+        threading.Timer(0.1, gate.set).start()
+        batch.close()
+        self.assertLessEqual(len(started), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
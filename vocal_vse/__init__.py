@@ -17,10 +17,12 @@ except ImportError:
     pass
 else:
     from logging import getLogger
+    from bpy.app.handlers import persistent
+    from .core import config
 
     logger = getLogger(__name__)
     # Import submodules
-    from .operators.generate import VSE_OT_generate_narration
+    from .operators.generate import VSE_OT_generate_narration, shutdown_executor
     from .operators.refresh import VSE_OT_refresh_narration
     from .operators.cleanup import VSE_OT_cleanup_narration_files
     from .operators.copy_path import VSE_OT_copy_audio_path
@@ -30,7 +32,7 @@ else:
     from .ui.preferences import VocalVSEPreferences
 
     # Collect all classes from the modules for registration
-    classes = [
+    classes = (
         VSE_OT_generate_narration,
         VSE_OT_refresh_narration,
         VSE_OT_cleanup_narration_files,
@@ -39,26 +41,38 @@ else:
         VOCAL_OT_reload_voices_config,
         SEQUENCER_PT_tts_panel,
         VocalVSEPreferences,
-    ]
+    )
+
+    _register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
+    @persistent
+    def _reset_output_dir(*args):
+        # Opening or saving (as) a blend file changes where narrations belong
+        config.reset_output_dir()
+
+    _file_handlers = (bpy.app.handlers.load_post, bpy.app.handlers.save_post)
 
     def register():
         logger.info("Registering Vocal VSE Add-on...")
-        for cls in classes:
-            try:
-                bpy.utils.register_class(cls)
-            except Exception as e:
-                logger.error(
-                    f"Failed to register {cls}: {e}", exc_info=True
-                )  # <-- Use logger.error
+        try:
+            _register_classes()
+        except Exception as e:
+            logger.error(f"Failed to register classes: {e}", exc_info=True)
+        for handlers in _file_handlers:
+            if _reset_output_dir not in handlers:
+                handlers.append(_reset_output_dir)
 
     def unregister():
         logger.info("Unregistering Vocal VSE Add-on...")
-        # --- UNREGISTER IN REVERSE ORDER ---
-        for cls in reversed(classes):
-            try:
-                bpy.utils.unregister_class(cls)
-            except Exception as e:
-                logger.error(f"Failed to unregister {cls}: {e}", exc_info=True)
+        for handlers in _file_handlers:
+            if _reset_output_dir in handlers:
+                handlers.remove(_reset_output_dir)
+        # register_classes_factory unregisters in reverse order
+        try:
+            _unregister_classes()
+        except Exception as e:
+            logger.error(f"Failed to unregister classes: {e}", exc_info=True)
+        shutdown_executor()
 
     # Module reload support (optional, useful for development)
     if __name__ == "__main__":
@@ -1,16 +1,36 @@
 import importlib
+import json
 import os
+import sys
 from logging import getLogger
 import platform
+from .file_manager import ensure_dir
 
 logger = getLogger(__name__)
+_IS_WINDOWS = platform.system() == "Windows"
+_HOME = os.path.expanduser("~")
+if _IS_WINDOWS:
+    _CONFIG_ROOT = os.path.join(_HOME, "AppData", "Roaming")
+    _CACHE_ROOT = os.path.join(_HOME, "AppData", "Local", "cache")
+else:  # Linux/macOS
+    _CONFIG_ROOT = os.path.join(_HOME, ".config")
+    _CACHE_ROOT = os.path.join(_HOME, ".cache")
+# Parsed voices.toml per path, with the (mtime_ns, size) it was parsed at
+# (None if it could not be read or created)
+_voices_cache = {}
+# Synthesizer classes resolved from "module:ClassName" specs
+_synthesizer_classes = {}
+# Synthesizer instances per voice profile, with the profile settings they were built from
+_synthesizers = {}
+# Development aid: re-import synthesizer modules on every get_voice()
+_RELOAD_HANDLERS = bool(os.environ.get("VOCAL_VSE_RELOAD_HANDLERS"))
 
 
 class Config:
     config_dir: str
     voices_config_path: str
     default_output_dir: str
-    voices: dict
+    tomllib: object
 
     def __getattr__(self, name):
         f = not name.startswith("_get_") and getattr(self, f"_get_{name}", None)
@@ -32,14 +52,7 @@ class Config:
 
     def _get_config_dir(self):
         """Get the standard config directory for the add-on."""
-        home = os.path.expanduser("~")
-        if os.name == "nt":  # Windows
-            config_dir = os.path.join(home, "AppData", "Roaming")
-        else:  # Linux/macOS
-            config_dir = os.path.join(home, ".config")
-        addon_config_dir = os.path.join(config_dir, "vocal_vse")
-        os.makedirs(addon_config_dir, exist_ok=True)
-        return addon_config_dir
+        return ensure_dir(os.path.join(_CONFIG_ROOT, "vocal_vse"))
 
     def _get_voices_config_path(self):
         """Get the path to the voices.toml file."""
@@ -65,7 +78,7 @@ class Config:
                 f"{os.path.splitext(os.path.basename(blend_filepath))[0]}_narrations",
             )
             try:
-                os.makedirs(narrations_dir, exist_ok=True)
+                ensure_dir(narrations_dir)
                 logger.info(f"Using project-specific output dir: {narrations_dir}")
                 return narrations_dir
             except OSError as e:
@@ -74,80 +87,127 @@ class Config:
                 )
 
         # Blend file is unsaved or creating project dir failed, use cache
-        home = os.path.expanduser("~")
-        if platform.system() == "Windows":
-            cache_dir = os.path.join(home, "AppData", "Local", "cache")
-        else:
-            cache_dir = os.path.join(home, ".cache")
-        narrations_dir = os.path.join(cache_dir, "narrations")
-        os.makedirs(narrations_dir, exist_ok=True)
+        narrations_dir = os.path.join(_CACHE_ROOT, "narrations")
+        ensure_dir(narrations_dir)
         logger.info(f"Using fallback cache output dir: {narrations_dir}")
         return narrations_dir
 
+    def _get_tomllib(self):
+        """TOML parser module, imported on first use (None if unavailable)."""
+        # Prefer the C-extension parsers when installed; all expose loads(str)
+        for name in ("rtoml", "pytomlpp", "tomllib", "tomli"):
+            try:
+                return importlib.import_module(name)
+            except ImportError:
+                pass
+        logger.error(
+            "Error: Either 'tomllib' (Python 3.11+) or 'tomli' library is required. Please install 'tomli' in Blender's Python environment."
+        )
+        return None
+
     def _load_voices(self):
         """Load voice profiles from voices.toml."""
-        # Check for tomllib (Python 3.11+) or fallback to toml library
+        config_path = self.voices_config_path
+        cached = _voices_cache.get(config_path)
+        # Panels read this on every redraw, so a file that could not be read
+        # or created is retried only once it shows up or Reload Voices is used
+        failed = cached is not None and cached[0] is None
         try:
-            import tomllib  # Standard library in Python 3.11+
-        except ImportError:
             try:
-                import tomli as tomllib
-            except ImportError:
-                logger.error(
-                    "Error: Either 'tomllib' (Python 3.11+) or 'tomli' library is required. Please install 'tomli' in Blender's Python environment."
-                )
-                return {}
+                st = os.stat(config_path)
+            except FileNotFoundError:
+                if failed:
+                    return cached[1]
+                create_default_voices_config(config_path)
+                st = os.stat(config_path)
+        except OSError as e:
+            if failed:
+                return cached[1]
+            logger.error(f"Error reading voices config {config_path}: {e}")
+            _voices_cache[config_path] = (None, {})
+            return {}
 
-        config_path = self.voices_config_path
-        if not os.path.exists(config_path):
-            create_default_voices_config(config_path)
-            logger.info(f"Created default voices config at {config_path}")
+        key = (st.st_mtime_ns, st.st_size)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        tomllib = self.tomllib
+        if tomllib is None:
+            return {}
 
         try:
-            # tomllib.load requires a binary file handle
-            with open(config_path, "rb") as f:
-                config = tomllib.load(f)
-            return config
+            with open(config_path, encoding="utf-8") as f:
+                config = tomllib.loads(f.read())
         except Exception as e:
             logger.error(
                 f"Error loading voices config from {config_path}: {e}", exc_info=True
             )
-            return {}
-
-    def _get_voices(self):
+            config = {}
+        # A broken file is not re-parsed until it changes
+        _voices_cache[config_path] = (key, config)
+        return config
+
+    @property
+    def voices(self):
+        """Voice profiles from voices.toml, re-parsed only when the file changes."""
         return self._load_voices()
 
+    def reset_output_dir(self):
+        # default_output_dir depends on bpy.data.filepath; recompute on next access
+        self.__dict__.pop("default_output_dir", None)
+
     def reload_voices(self):
-        self.voices = self._load_voices()
+        _voices_cache.pop(self.voices_config_path, None)
+        # Resolve synthesizer classes and engines afresh on next use
+        _synthesizer_classes.clear()
+        _synthesizers.clear()
 
     def get_voice(self, voice_id=""):
 
         entry: dict = self.voices.get(voice_id)
         assert entry, f"Unexpected voice {voice_id}"
+        # Reuse the handler (and its initialized engine) while the profile is unchanged
+        entry_key = json.dumps(entry, sort_keys=True, default=str)
+        cached = not _RELOAD_HANDLERS and _synthesizers.get(voice_id)
+        if cached and cached[0] == entry_key:
+            return cached[1]
         synthesizer_spec = entry.get("synthesizer")
         assert (
             synthesizer_spec
         ), f"Synthesizer not specified for voice profile '{voice_id}'."
-        if ":" in synthesizer_spec:
-            module_part, class_part = synthesizer_spec.rsplit(":", 1)
-        else:
-            raise RuntimeError(
-                f"Invalid synthesizer spec '{synthesizer_spec}' for profile '{voice_id}'. Expected format 'module:ClassName'.",
-            )
-        if module_part.startswith("."):
-            handler_module_name = f"vocal_vse.tts{module_part}"
-        else:
-            handler_module_name = synthesizer_spec
-
-        handler_module = importlib.import_module(handler_module_name)
-        SynthesizerClass = getattr(handler_module, class_part)
+        SynthesizerClass = _synthesizer_classes.get(synthesizer_spec)
+        if SynthesizerClass is None or _RELOAD_HANDLERS:
+            if ":" in synthesizer_spec:
+                module_part, class_part = synthesizer_spec.rsplit(":", 1)
+            else:
+                raise RuntimeError(
+                    f"Invalid synthesizer spec '{synthesizer_spec}' for profile '{voice_id}'. Expected format 'module:ClassName'.",
+                )
+            if module_part.startswith("."):
+                handler_module_name = f"vocal_vse.tts{module_part}"
+            else:
+                handler_module_name = module_part
+
+            if _RELOAD_HANDLERS and handler_module_name in sys.modules:
+                # Pick up edited modules and newly installed packages
+                importlib.invalidate_caches()
+                handler_module = importlib.reload(sys.modules[handler_module_name])
+            else:
+                handler_module = importlib.import_module(handler_module_name)
+            SynthesizerClass = getattr(handler_module, class_part)
+            _synthesizer_classes[synthesizer_spec] = SynthesizerClass
         handler_params = entry.get("params", {})
         handler_instance = SynthesizerClass(**handler_params)
+        # Optional per-profile override of how many items a batch runs at once
+        max_concurrency = entry.get("max_concurrency")
+        if max_concurrency:
+            handler_instance.max_concurrency = int(max_concurrency)
 
         if not handler_instance.is_available():
             raise RuntimeError(
                 f"Synthesizer '{synthesizer_spec}' is not available. Please check dependencies (e.g., install required library).",
             )
+        _synthesizers[voice_id] = (entry_key, handler_instance)
         return handler_instance
 
 
@@ -167,10 +227,17 @@ synthesizer=".gtts:Synthesizer"
 # https://gtts.readthedocs.io/en/latest/module.html#module-gtts.tts
 # example : {lang = "en", tld="com", slow=True}
 params={lang = "en"}
+# Optional: how many strips to synthesize at once (default 1)
+# Higher values for gTTS risk HTTP 429 rate-limit errors from Google
+# max_concurrency=2
 """
     try:
-        with open(config_path, "w") as f:
+        # "x" never clobbers a file created since the caller's stat
+        with open(config_path, "x", encoding="utf-8") as f:
             f.write(default_config.strip())
+        logger.info(f"Created default voices config at {config_path}")
+    except FileExistsError:
+        pass
     except Exception as e:
         logger.error(f"Error creating default config file: {e}", exc_info=True)
 
@@ -1,34 +1,129 @@
 import os
-import time
+import re
+import hashlib
 from secrets import token_bytes
 from base64 import b32encode
 
+# Names shared by narration files, sound strips and text-strip properties
+ID_PROP = "tts_id"
+HASH_PROP = "tts_hash"
+FILE_PREFIX = "voc_"
+STRIP_PREFIX = "Voc_"
+AUDIO_EXT = ".wav"
+# voc_<tts_id>_<content hash, or hex timestamp for older files>.wav
+_NARRATION_RE = re.compile(
+    rf"{re.escape(FILE_PREFIX)}([a-z2-7]+)_([0-9a-f]+){re.escape(AUDIO_EXT)}\Z"
+)
+# Voc_<tts_id>, plus the ".001"-style suffix Blender gives duplicated strips
+_STRIP_RE = re.compile(rf"{re.escape(STRIP_PREFIX)}([a-z2-7]+)(?:\.\d+)?\Z")
+
+# Narration file index per output directory, with the directory mtime it was built at
+_files_index_cache = {}
+
+
+def ensure_dir(path):
+    """os.makedirs(path, exist_ok=True), checked on every call.
+
+    The folder can be deleted while Blender is running, so nothing is cached.
+    """
+    # One stat for the usual case where it exists; makedirs walks the parents
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    return path
+
 
 def get_or_create_strip_id(strip):
-    if "tts_id" not in strip:
-        new_id = b32encode(token_bytes(5)).decode("ascii").rstrip("=").lower()
-        strip["tts_id"] = new_id
-    return strip["tts_id"]
+    strip_id = strip.get(ID_PROP)
+    if strip_id is None:
+        strip_id = b32encode(token_bytes(5)).decode("ascii").rstrip("=").lower()
+        strip[ID_PROP] = strip_id
+    return strip_id
 
 
-def generate_audio_filename(output_dir, strip):
+def content_hash(text, voice=""):
+    """Short SHA-256 of the voice settings and text, used to name cached audio."""
+    return hashlib.sha256(f"{voice}|{text}".encode("utf-8")).hexdigest()[:16]
+
+
+def generate_audio_filename(output_dir, strip, digest):
     strip_id = get_or_create_strip_id(strip)
-    return os.path.join(output_dir, f"voc_{strip_id}_{int(time.time() % 65536):x}.wav")
+    return os.path.join(output_dir, f"{FILE_PREFIX}{strip_id}_{digest}{AUDIO_EXT}")
 
 
-def find_existing_audio_for_text(scene, text_strip):
-    if "tts_id" not in text_strip:
-        return None
-    target_id = text_strip["tts_id"]
+def index_narration_strips(scene):
+    """Map each tts_id to its narration sound strip in one pass over the sequencer."""
+    index = {}
     for strip in scene.sequence_editor.sequences_all:
-        if strip.type == "SOUND" and f"oc_{target_id}" in strip.name:
-            return strip
-    return None
+        if strip.type == "SOUND":
+            m = _STRIP_RE.match(strip.name)
+            if m:
+                index.setdefault(m.group(1), strip)
+    return index
+
+
+def has_audio(path):
+    """True if path is a file larger than a bare 44-byte WAV header."""
+    try:
+        return os.stat(path).st_size > 44
+    except OSError:
+        return False
+
+
+def find_existing_audio_for_text(scene, text_strip, index=None):
+    target_id = text_strip.get(ID_PROP)
+    if target_id is None:
+        return None
+    if index is None:
+        index = index_narration_strips(scene)
+    return index.get(target_id)
+
+
+def parse_narration_filename(name):
+    """Return the tts_id of a narration file name, or None for other files."""
+    m = _NARRATION_RE.match(name)
+    return m.group(1) if m else None
+
+
+def iter_narration_files(output_dir):
+    """
+    Yield (tts_id, os.DirEntry) for each narration file in output_dir, in
+    directory order. A missing directory yields nothing.
+    """
+    try:
+        it = os.scandir(output_dir)
+    except FileNotFoundError:
+        return
+    with it:
+        for entry in it:
+            strip_id = parse_narration_filename(entry.name)
+            if strip_id:
+                yield strip_id, entry
 
 
-def get_all_narration_files(output_dir):
-    if not os.path.exists(output_dir):
-        return []
-    return [
-        f for f in os.listdir(output_dir) if f.startswith("voc_") and f.endswith(".wav")
-    ]
+def get_files_by_tts_id(output_dir):
+    """
+    Map each tts_id to its narration file names, oldest first by mtime, reused
+    until the directory's mtime changes. The result is shared: do not modify it.
+    """
+    try:
+        # Stat before scanning, so files added during the scan force a rebuild
+        key = os.stat(output_dir).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    cached = _files_index_cache.get(output_dir)
+    if cached and cached[0] == key:
+        return cached[1]
+    dated = {}
+    for strip_id, entry in iter_narration_files(output_dir):
+        try:
+            # Names end in a content hash, so only mtime gives generation order
+            mtime = entry.stat().st_mtime_ns
+        except OSError:
+            continue  # Deleted since the directory was listed
+        dated.setdefault(strip_id, []).append((mtime, entry.name))
+    index = {
+        strip_id: [name for _, name in sorted(files)]
+        for strip_id, files in dated.items()
+    }
+    _files_index_cache[output_dir] = (key, index)
+    return index
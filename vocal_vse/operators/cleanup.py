@@ -1,6 +1,14 @@
 import bpy
 import os
-from ..core import config, file_manager  # Or import functions
+from concurrent.futures import ThreadPoolExecutor
+from ..core import config, file_manager
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError as e:
+        return e
 
 
 class VSE_OT_cleanup_narration_files(bpy.types.Operator):
@@ -21,39 +29,35 @@ class VSE_OT_cleanup_narration_files(bpy.types.Operator):
         # --- 1. Get paths of audio files currently used by SOUND strips ---
         used_sound_strip_paths = set()
         for strip in context.scene.sequence_editor.sequences_all:
-            if strip.type == "SOUND":
-                # Get the absolute path of the sound file used by the strip
-                # bpy.path.abspath handles relative paths (e.g., //audio.wav)
-                abs_filepath = bpy.path.abspath(
-                    strip.sound.filepath, library=strip.sound.library
-                )
+            if strip.type == "SOUND" and strip.sound:
+                sound = strip.sound
+                abs_filepath = sound.filepath
+                # Narrations are linked by absolute path; only blend-relative
+                # paths (e.g., //audio.wav) need bpy.path.abspath
+                if abs_filepath.startswith("//") or not os.path.isabs(abs_filepath):
+                    abs_filepath = bpy.path.abspath(abs_filepath, library=sound.library)
                 # Normalize the path for comparison
                 normalized_path = os.path.normpath(abs_filepath)
                 used_sound_strip_paths.add(normalized_path)
                 # Debug: print(f"Sound strip '{strip.name}' uses: {normalized_path}")
 
-        # --- 2. Get paths of all narration files in the output directory ---
-        all_narration_filenames = file_manager.get_all_narration_files(output_dir)
-        all_narration_paths = {
-            os.path.normpath(os.path.join(output_dir, filename))
-            for filename in all_narration_filenames
-        }
-        # Debug: print(f"All narration paths: {all_narration_paths}")
-
-        # --- 3. Identify unused narration files ---
-        # Files in all_narration_paths but NOT in used_sound_strip_paths
-        unused_narration_paths = all_narration_paths - used_sound_strip_paths
-        # Debug: print(f"Unused narration paths: {unused_narration_paths}")
+        # --- 2. Collect unused narration files in a single directory pass ---
+        # Files in the output directory but NOT in used_sound_strip_paths
+        unused_paths = []
+        for _, entry in file_manager.iter_narration_files(output_dir):
+            if os.path.normpath(entry.path) not in used_sound_strip_paths:
+                unused_paths.append(entry.path)
 
-        # --- 4. Delete the unused files ---
+        # --- 3. Delete them concurrently ---
+        # Each remove is a round trip on network-mounted output directories
         deleted_count = 0
-        for file_path in unused_narration_paths:
-            try:
-                os.remove(file_path)
-                # Debug: print(f"Deleted: {file_path}")
-                deleted_count += 1
-            except OSError as e:
-                self.report({"WARNING"}, f"Could not delete {file_path}: {e}")
+        if unused_paths:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                for path, error in zip(unused_paths, pool.map(_remove, unused_paths)):
+                    if error is None:
+                        deleted_count += 1
+                    else:
+                        self.report({"WARNING"}, f"Could not delete {path}: {error}")
 
         self.report(
             {"INFO"},
@@ -9,18 +9,25 @@ class VSE_OT_copy_audio_path(bpy.types.Operator):
     bl_description = "Copy the file path of the latest generated audio for the selected text strip to the clipboard"
 
     def execute(self, context):
+        output_dir = config.default_output_dir
+        # File lists per tts_id, oldest first, rescanned only when the directory changes
+        index = None
         for strip in context.selected_sequences:
-            if strip.type == "TEXT" and "tts_id" in strip:
-                output_dir = config.default_output_dir
-                files = [
-                    f
-                    for f in file_manager.get_all_narration_files(
-                        output_dir
-                    )  # Use imported function
-                    if strip["tts_id"] in f
-                ]
+            strip_id = strip.type == "TEXT" and strip.get(file_manager.ID_PROP)
+            if strip_id:
+                if index is None:
+                    index = file_manager.get_files_by_tts_id(output_dir)
+                files = index.get(strip_id)
                 if files:
-                    latest = sorted(files)[-1]
+                    # Prefer the audio from the strip's last generate run
+                    tts_hash = strip.get(file_manager.HASH_PROP)
+                    current = f"{file_manager.FILE_PREFIX}{strip_id}_{tts_hash}{file_manager.AUDIO_EXT}"
+                    if current in files:
+                        latest = current
+                    else:
+                        # Ordered by mtime from the DirEntry stats, so no file is
+                        # stat'ed again here (it may have been deleted since)
+                        latest = files[-1]
                     path = os.path.join(output_dir, latest)
                     context.window_manager.clipboard = path
                     self.report({"INFO"}, f"Copied: {path}")
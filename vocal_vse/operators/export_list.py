@@ -4,6 +4,18 @@ import os
 import json
 from ..core import config as config, file_manager
 
+try:
+    import orjson  # Optional, much faster encoder
+except ImportError:
+    orjson = None
+
+
+def _dump_json(data) -> bytes:
+    # orjson only indents by 2; stock Blender has no orjson and keeps indent=4
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+
 
 class VSE_OT_export_narration_list(bpy.types.Operator):
     bl_idname = "sequencer.export_narration_list"
@@ -51,14 +63,21 @@ class VSE_OT_export_narration_list(bpy.types.Operator):
         # Ensure the target directory for the export file exists
         export_dir = os.path.dirname(self.filepath)
         if export_dir:
-            os.makedirs(export_dir, exist_ok=True)
+            file_manager.ensure_dir(export_dir)
+
+        # Audio files grouped by tts_id, oldest first, rescanned only when the dir
+        # changes; looked up on the first narrated strip so empty scenes skip it
+        files_by_id = None
 
         # Gather data
         narration_data = []
         # Iterate through ALL sequences to find text strips with tts_id
         for strip in context.scene.sequence_editor.sequences_all:
-            if strip.type == "TEXT" and "tts_id" in strip:
-                tts_id = strip["tts_id"]
+            if strip.type != "TEXT":
+                continue
+            # One ID-property lookup instead of "in" followed by []
+            tts_id = strip.get(file_manager.ID_PROP)
+            if tts_id is not None:
                 strip_name = strip.name
                 # --- Include the text content ---
                 strip_text = strip.text
@@ -67,13 +86,9 @@ class VSE_OT_export_narration_list(bpy.types.Operator):
                 frame_end = strip.frame_final_end
 
                 # Find corresponding audio files
-                all_narration_files = file_manager.get_all_narration_files(
-                    audio_output_dir
-                )
-                matching_files = [
-                    f for f in all_narration_files if f.startswith(f"voc_{tts_id}_")
-                ]
-                matching_files.sort()  # Sort for consistency
+                if files_by_id is None:
+                    files_by_id = file_manager.get_files_by_tts_id(audio_output_dir)
+                matching_files = files_by_id.get(tts_id, [])
 
                 # Add entry for this text strip
                 narration_data.append(
@@ -103,8 +118,19 @@ class VSE_OT_export_narration_list(bpy.types.Operator):
                 "narrations": narration_data,
             }
 
-            with open(self.filepath, "w", encoding="utf-8") as jsonfile:
-                json.dump(export_data, jsonfile, indent=4, ensure_ascii=False)
+            # Write beside the target and rename, so a failed export never
+            # leaves a truncated file in place of the previous one
+            tmp_path = self.filepath + ".tmp"
+            try:
+                with open(tmp_path, "wb") as jsonfile:
+                    jsonfile.write(_dump_json(export_data))
+                os.replace(tmp_path, self.filepath)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
 
             self.report({"INFO"}, f"Narration list exported to '{self.filepath}'")
             return {"FINISHED"}
@@ -1,9 +1,11 @@
 import os
-import importlib
-import queue
+import json
+import atexit
+import itertools
+from collections import deque
 import concurrent.futures
 import threading
-from time import perf_counter, strftime
+from time import perf_counter
 import traceback  # For better error reporting in threads
 from logging import getLogger
 from tempfile import gettempdir
@@ -12,17 +14,73 @@ import bpy
 
 logger = getLogger(__name__)
 # --- Message Types for Queue Communication ---
-MSG_PROGRESS = "progress_update"
-MSG_ERROR = "error"
+MSG_PROGRESS = "progress_update"  # One per strip, carrying its result or error
 MSG_CRITICAL_ERROR = "critical_error"
-MSG_RESULT = "result"
 MSG_FINISHED = "finished"
 # ---------------------------------------------
 
+# Modal timer intervals: fast while results arrive, slow once the worker goes quiet
+TIMER_FAST = 0.1
+TIMER_SLOW = 0.4
+TIMER_IDLE_TICKS = 5  # Empty ticks before slowing down
+
+# Worker pool shared by all generate invocations, created on first use
+_executor = None
+
+# EnumProperty items must stay referenced from Python; the list is rebuilt
+# only when config.voices hands back a different (re-parsed) dict
+_voice_profile_items = []
+_voice_profile_source = None
+
+
+def get_executor():
+    """Return the shared background pool, starting it if needed."""
+    global _executor
+    if _executor is None:
+        # One task at a time: handlers are cached per profile and engines such
+        # as pyttsx3 cannot run two batches at once. Each batch is still
+        # parallel internally, up to the handler's max_concurrency.
+        _executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="VocalVSE_Task"
+        )
+    return _executor
+
+
+@atexit.register
+def shutdown_executor():
+    """Stop the shared pool; running tasks finish, queued ones are dropped."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def prepare_jobs(selected_sequences, output_dir, voice_key=""):
+    """
+    Snapshot everything the background task needs from the text strips.
+    Must run on the main thread: it reads strip data and may assign tts_id.
+
+    Returns (strips, jobs): the text strips, and a parallel list of plain
+    (strip_name, text, filepath, digest) tuples for the worker.
+    """
+    strips = []
+    jobs = []
+    for strip in selected_sequences:
+        if strip.type != "TEXT":
+            continue
+        text = strip.text
+        if not text.strip():
+            continue
+        digest = file_manager.content_hash(text, voice_key)
+        filepath = file_manager.generate_audio_filename(output_dir, strip, digest)
+        strips.append(strip)
+        jobs.append((strip.name, text, filepath, digest))
+    return strips, jobs
+
 
 def background_synthesis_task(
     handler_instance,
-    selected_sequences,
+    jobs,  # Plain-data jobs from prepare_jobs(); no Blender objects
     output_dir,  # Use the output_dir passed in, not context
     message_queue,
     stop_event,  # threading.Event to check for cancellation
@@ -32,56 +90,65 @@ def background_synthesis_task(
     Communicates back via message_queue.
     Checks stop_event periodically to allow early exit.
     """
-    total = len(selected_sequences)
-    os.makedirs(output_dir, exist_ok=True)
+    file_manager.ensure_dir(output_dir)
 
     try:
-        for i, strip in enumerate(selected_sequences):
+        # Audio already on disk for the same text and voice is reused as-is
+        pending = [
+            i for i, job in enumerate(jobs) if not file_manager.has_audio(job[2])
+        ]
+        cached = sorted(set(range(len(jobs))).difference(pending))
+
+        # Hand every job to the handler at once so engines that support it
+        # (e.g. pyttsx3) can synthesize the whole batch in one driver run
+        results = handler_instance.synthesize_batch(
+            [(jobs[i][1], jobs[i][2]) for i in pending]
+        )
+        results = itertools.chain(
+            ((i, None) for i in cached),
+            ((pending[j], error) for j, error in results),
+        )
+        for done, (i, error) in enumerate(results, 1):
             # --- Check for cancellation ---
             if stop_event.is_set():
                 logger.warning(f"Background task was cancelled.")
                 # It's good practice to signal finish even if cancelled
                 # so the main thread knows the worker is done.
-                message_queue.put({"type": MSG_FINISHED})
+                message_queue.append({"type": MSG_FINISHED})
                 return  # Exit the function early
             # --------------------------------
 
-            if strip.type != "TEXT" or not strip.text.strip():
-                continue
-
-            filepath = file_manager.generate_audio_filename(output_dir, strip)
-            error_msg = ""
-            try:
-                # This is the potentially long-running call
-                handler_instance.synthesize(strip.text, filepath)
-                # --- Send Result via Queue ---
-                message_queue.put(
-                    {
-                        "type": MSG_RESULT,
-                        "data": {
-                            "strip_name": strip.name,
-                            "filepath": filepath,
-                            "text_strip": strip,  # Pass the strip object reference
-                        },
-                    }
-                )
-                # ----------------------------
-            except Exception as e:
-                error_msg = f"Error generating audio for '{strip.name}': {e}\n{traceback.format_exc()}"
-                # --- Send Error via Queue ---
-                message_queue.put({"type": MSG_ERROR, "data": error_msg})
-                # ---------------------------
-
-            # --- Send Progress Update via Queue ---
-            message_queue.put(
+            strip_name, _, filepath, digest = jobs[i]
+            if error is None and not file_manager.has_audio(filepath):
+                # e.g. pyttsx3 writes a header-only WAV when the device is busy
+                error = RuntimeError(f"No audio was written to '{filepath}'")
+            result = None
+            if error is not None:
+                # A failed run may leave a partial file at the cached path,
+                # which later runs would otherwise reuse as finished audio
+                try:
+                    os.unlink(filepath)
+                except OSError:
+                    pass
+            else:
+                result = {
+                    "strip_name": strip_name,
+                    "filepath": filepath,
+                    "digest": digest,
+                    "index": i,  # Position of the text strip in the operator's job list
+                }
+
+            # --- Send the strip's outcome and progress as one message ---
+            message_queue.append(
                 {
                     "type": MSG_PROGRESS,
                     "data": {
-                        "progress": i + 1,
-                        "current_strip": strip.name,
-                        "has_error": bool(
-                            error_msg
-                        ),  # Optional: indicate error in progress
+                        "progress": done,
+                        "current_strip": strip_name,
+                        "result": result,  # Result dict, or None on error
+                        # The exception itself; its traceback is formatted only
+                        # if the main thread writes it to the log
+                        "error": error,
                     },
                 }
             )
@@ -91,7 +158,7 @@ def background_synthesis_task(
         # If loop finished normally, send finished signal
         # Redundant check, but safe
         if not stop_event.is_set():
-            message_queue.put({"type": MSG_FINISHED})
+            message_queue.append({"type": MSG_FINISHED})
         # ------------------------------------------
 
     except Exception as e:
@@ -100,9 +167,9 @@ def background_synthesis_task(
             f"Critical error in background task: {e}\n{traceback.format_exc()}"
         )
         # --- Send Critical Error via Queue ---
-        message_queue.put({"type": MSG_CRITICAL_ERROR, "data": critical_error_msg})
+        message_queue.append({"type": MSG_CRITICAL_ERROR, "data": critical_error_msg})
         # --- Also Signal Finished (even with error) ---
-        message_queue.put({"type": MSG_FINISHED})
+        message_queue.append({"type": MSG_FINISHED})
         # ---------------------------------------------
 
 
@@ -118,7 +185,10 @@ class VSE_OT_generate_narration(bpy.types.Operator):
 
     # --- Properties ---
     def get_voice_profiles(self, context):
+        global _voice_profile_source
         voices_config = config.voices
+        if voices_config is _voice_profile_source:
+            return _voice_profile_items
         items = [
             (k, v.get("name", k), f"Voice profile: {k}")
             for (k, v) in voices_config.items()
@@ -131,7 +201,9 @@ class VSE_OT_generate_narration(bpy.types.Operator):
                     "Please configure voices in ~/.config/vocal_vse/voices.toml",
                 )
             ]
-        return items
+        _voice_profile_items[:] = items
+        _voice_profile_source = voices_config
+        return _voice_profile_items
 
     voice_profile: bpy.props.EnumProperty(
         name="Voice Profile",
@@ -141,23 +213,26 @@ class VSE_OT_generate_narration(bpy.types.Operator):
 
     # --- Instance variables for state (instead of global dict) ---
     # These will be initialized in invoke()
-    # executor: concurrent.futures.ThreadPoolExecutor
     # future: concurrent.futures.Future
-    # message_queue: queue.Queue
+    # message_queue: collections.deque
     # stop_event: threading.Event
     # total: int
     # voice_profile_name: str
     # collected_results: list # Store results from queue
-    # collected_errors: list  # Store errors from queue
+    # collected_errors: list  # (message, exception or None) pairs from the queue
     # critical_error: str     # Store critical error
     # task_finished: bool     # Custom flag from MSG_FINISHED
-    # selected_sequences: list # Store for use in modal
+    # job_strips: list # Text strips being narrated, in job order (see prepare_jobs)
 
     @classmethod
     def poll(cls, context):
-        return context.scene.sequence_editor is not None and any(
-            s.type == "TEXT" for s in context.selected_sequences
-        )
+        if context.scene.sequence_editor is None:
+            return False
+        # The active strip is usually the selected text strip; skip the scan then
+        active = context.active_sequence_strip
+        if active and active.select and active.type == "TEXT":
+            return True
+        return any(s.type == "TEXT" for s in context.selected_sequences)
 
     def invoke(self, context, event):
         # --- Validate voice_profile ---
@@ -178,33 +253,29 @@ class VSE_OT_generate_narration(bpy.types.Operator):
             return {"CANCELLED"}
 
         # --- Prepare for Background Execution ---
-        import uuid  # For unique executor name if needed
-
-        self.selected_sequences = [
-            s for s in context.selected_sequences if s.type == "TEXT" and s.text.strip()
-        ]
+        # Read the strips here, on the main thread; the worker only sees the snapshot
+        output_dir = config.default_output_dir
+        self.job_strips, jobs = prepare_jobs(
+            context.selected_sequences,
+            output_dir,
+            json.dumps(voices_config[self.voice_profile], sort_keys=True, default=str),
+        )
 
-        if not self.selected_sequences:
+        if not jobs:
             self.report({"WARNING"}, "No valid text strips selected for generation.")
             return {"CANCELLED"}
 
-        # --- Setup ThreadPoolExecutor and Communication ---
-        # Create a ThreadPoolExecutor.
-        # Using max_workers=1 ensures one task at a time per operator instance.
-        # Consider if a shared executor (e.g., module-level) is better for multiple concurrent ops.
-        # Include a unique part in the thread name for debugging.
-        self.executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=1, thread_name_prefix=f"VocalVSE_Task_{uuid.uuid4().hex[:8]}"
-        )
-
+        # --- Setup Communication ---
+        # Each invocation runs as one task on the shared pool (see get_executor)
         # Create a queue for messages from the background task
-        self.message_queue = queue.Queue()
+        # (single producer, single consumer: a deque is enough)
+        self.message_queue = deque()
 
         # Create an event to signal the background task to stop
         self.stop_event = threading.Event()
 
         # Store other necessary state on self
-        self.total = len(self.selected_sequences)
+        self.total = len(jobs)
         self.voice_profile_name = self.voice_profile  # Store profile name for reporting
         # Initialize lists/dict to collect data from the queue in modal
         self.collected_results = []
@@ -215,19 +286,21 @@ class VSE_OT_generate_narration(bpy.types.Operator):
 
         # --- Submit Task to Executor ---
         # Note: We pass the stop_event and the pre-determined output_dir to the task function
-        self.future = self.executor.submit(
+        self.future = get_executor().submit(
             background_synthesis_task,
             handler_instance,
-            self.selected_sequences,
-            config.default_output_dir,  # Pass the determined output_dir
+            jobs,
+            output_dir,  # Pass the determined output_dir
             self.message_queue,
             self.stop_event,  # Pass the stop event
         )
         # --------------------------------
 
         # --- Start Modal Timer ---
-        # This will call modal() every 0.1 seconds to check progress
-        self._timer = context.window_manager.event_timer_add(0.4, window=context.window)
+        # This will call modal() every TIMER_FAST seconds to check progress
+        self._timer = None
+        self._idle_ticks = 0
+        self._set_timer(context, TIMER_FAST)
         context.window_manager.modal_handler_add(self)
 
         self.report(
@@ -239,66 +312,54 @@ class VSE_OT_generate_narration(bpy.types.Operator):
     def modal(self, context, event):
         # --- Handle Timer Events ---
         if event.type == "TIMER":
+            # Checked before draining: once the worker has returned, everything
+            # it sent is already in the queue and gets processed below
+            worker_done = self.future.done()
             # --- Process messages from the background task ---
-            # Drain all available messages from the queue
-            while True:
-                try:
-                    message = self.message_queue.get_nowait()
-                    msg_type = message.get("type")
-                    msg_data = message.get("data")
-
-                    if msg_type == MSG_PROGRESS:
-                        # Update local view (could be used by a panel if exposed)
-                        # For now, just process the data
-                        # self.progress = msg_data["progress"] # If you add a progress prop
-                        # self.current_strip = msg_data["current_strip"] # If you add a current_strip prop
-                        # print(f"Progress Update: {msg_data['progress']}/{self.total} - {msg_data['current_strip']}")
-                        pass  # Processing done by reading msg_data directly when needed
-
-                    elif msg_type == MSG_ERROR:
-                        # Store error locally for final reporting
+            # deque.append/popleft are atomic, so the worker needs no lock;
+            # take only what is there now, later messages wait for the next tick
+            message_queue = self.message_queue
+            drained = len(message_queue)
+            for _ in range(drained):
+                message = message_queue.popleft()
+                msg_type = message.get("type")
+                msg_data = message.get("data")
+
+                if msg_type == MSG_PROGRESS:
+                    # Store the strip's outcome locally for final processing
+                    error = msg_data["error"]
+                    if error is not None:
                         self.collected_errors.append(
-                            msg_data
-                        )  # msg_data is the error string
-
-                    elif msg_type == MSG_CRITICAL_ERROR:
-                        # Store critical error
-                        self.critical_error = msg_data  # msg_data is the error string
-
-                    elif msg_type == MSG_RESULT:
-                        # Store result locally for final processing
-                        self.collected_results.append(
-                            msg_data
-                        )  # msg_data is the result dict
-
-                    elif msg_type == MSG_FINISHED:
-                        # Mark that the task signalled it's finished
-                        self.task_finished = True
-                        # Note: Don't break here immediately,
-                        # process any remaining messages first
-                        # Or handle finished logic after the message loop
-
-                except queue.Empty:
-                    # No more messages in the queue right now
-                    break  # Exit the message processing loop
+                            (
+                                f"Error generating audio for '{msg_data['current_strip']}': {error}",
+                                error,
+                            )
+                        )
+                    else:
+                        self.collected_results.append(msg_data["result"])
+                    # self.progress = msg_data["progress"] # If you add a progress prop
+
+                elif msg_type == MSG_CRITICAL_ERROR:
+                    # Store critical error
+                    self.critical_error = msg_data  # msg_data is the error string
+
+                elif msg_type == MSG_FINISHED:
+                    # Mark that the task signalled it's finished
+                    # (remaining messages in this batch are still processed)
+                    self.task_finished = True
             # -----------------------------------------------
 
             # --- Check if task is done (finished or cancelled) ---
             # The future's done() status reflects if the function returned or raised an exception
             # Using the custom self.task_finished flag (from MSG_FINISHED) is often more reliable
             # for custom completion signals or if the task exits early.
-            if self.future.done() or self.task_finished:
+            if worker_done or self.task_finished:
                 # --- Clean up timer ---
                 if hasattr(self, "_timer") and self._timer:
                     context.window_manager.event_timer_remove(self._timer)
+                    self._timer = None
                 # ---------------------
 
-                # --- Shutdown Executor ---
-                # It's good practice to shut down the executor when done.
-                # shutdown(wait=False) signals shutdown without blocking the main thread.
-                self.executor.shutdown(wait=False)
-                # -------------------------
-
                 # --- Gather final data (already collected on self) ---
                 results = self.collected_results
                 errors = self.collected_errors
@@ -315,43 +376,67 @@ class VSE_OT_generate_narration(bpy.types.Operator):
                 created_count = 0
                 # Re-check for errors when adding strips, just in case
                 final_errors = list(errors)  # Start with errors collected from queue
+                sequences = context.scene.sequence_editor.sequences
+
+                def add_error(strip_name, e):
+                    error_msg = f"Failed to add sound strip for '{strip_name}': {e}"
+                    logger.error(error_msg, exc_info=True)
+                    final_errors.append((error_msg, None))
+
+                # Walk the sequencer once instead of once per result
+                sound_index = file_manager.index_narration_strips(context.scene)
+                # Plan every change first, then remove and add in two tight passes
+                planned = []
+                to_remove = []
                 for result in results:
-                    strip_name = result["strip_name"]
-                    filepath = result["filepath"]
-                    text_strip = result["text_strip"]  # Get the original strip object
-
+                    # Resolve the original strip object here, on the main thread
+                    text_strip = self.job_strips[result["index"]]
                     try:
-                        # Add sound strip logic
-                        channel = text_strip.channel + 1
-                        frame_start = text_strip.frame_final_start
-                        sound_name = (
-                            f"Voc_{file_manager.get_or_create_strip_id(text_strip)}"
-                        )
-
-                        # Remove old strip if exists
                         old_strip = file_manager.find_existing_audio_for_text(
-                            context.scene, text_strip
+                            context.scene, text_strip, sound_index
                         )
                         if old_strip:
-                            context.scene.sequence_editor.sequences.remove(old_strip)
+                            to_remove.append((result["strip_name"], old_strip))
+                        planned.append(
+                            (
+                                result,
+                                text_strip,
+                                file_manager.STRIP_PREFIX
+                                + file_manager.get_or_create_strip_id(text_strip),
+                                text_strip.channel + 1,
+                                text_strip.frame_final_start,
+                            )
+                        )
+                    except Exception as e:
+                        add_error(result["strip_name"], e)
 
-                        # Add new sound strip
-                        context.scene.sequence_editor.sequences.new_sound(
+                # Remove old strips so their channels are free
+                for strip_name, old_strip in to_remove:
+                    try:
+                        sequences.remove(old_strip)
+                    except Exception as e:
+                        add_error(strip_name, e)
+
+                # Add new sound strips
+                for result, text_strip, sound_name, channel, frame_start in planned:
+                    try:
+                        sequences.new_sound(
                             name=sound_name,
-                            filepath=filepath,
+                            filepath=result["filepath"],
                             channel=channel,
                             frame_start=frame_start,
                         )
+                        # Remember which text/voice the audio was made from
+                        text_strip[file_manager.HASH_PROP] = result["digest"]
                         created_count += 1
                         # Report individual success if desired (might be verbose)
-                        # self.report({"INFO"}, f"Added audio for '{strip_name}'")
+                        # self.report({"INFO"}, f"Added audio for '{result['strip_name']}'")
                     except Exception as e:
-                        error_msg = f"Failed to add sound strip for '{strip_name}': {e}"
-                        logger.error(
-                            f"Failed to add sound strip for '{strip_name}': {e}",
-                            exc_info=True,
-                        )
-                        final_errors.append(error_msg)
+                        add_error(result["strip_name"], e)
+
+                # One undo step for the whole batch (the operator itself has no UNDO)
+                if to_remove or created_count:
+                    bpy.ops.ed.undo_push(message="Generate Narration")
 
                 # --- Report Final Status ---
                 # Check if stop event was set before finishing normally for cancellation report
@@ -371,12 +456,27 @@ class VSE_OT_generate_narration(bpy.types.Operator):
                         {"ERROR"}, f"Critical error during generation: {critical_error}"
                     )
                 elif final_errors:
-                    error_summary = "; ".join(final_errors[:3])  # Show first few errors
+                    # Show first few errors
+                    error_summary = "; ".join(msg for msg, _ in final_errors[:3])
                     log_path = os.path.join(gettempdir(), "vocal_vse.log")
                     try:
-                        with open(log_path, "a") as log_file:
-                            for err in final_errors:
-                                log_file.write(err + "\n")
+                        lines = []
+                        for msg, error in final_errors:
+                            lines.append(msg + "\n")
+                            if error is not None:
+                                lines.extend(
+                                    traceback.format_exception(
+                                        type(error), error, error.__traceback__
+                                    )
+                                )
+                        # Append the whole batch with a single write
+                        fd = os.open(
+                            log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                        )
+                        try:
+                            os.write(fd, "".join(lines).encode("utf-8"))
+                        finally:
+                            os.close(fd)
                         self.report(
                             {"ERROR"},
                             f"Generation completed with errors ({len(final_errors)}). See log: {log_path}. First few: {error_summary}",
@@ -396,6 +496,14 @@ class VSE_OT_generate_narration(bpy.types.Operator):
                 # --------------------------
 
                 return {"FINISHED"}  # Modal operator finished
+            # Adapt the polling rate to how fast results come in
+            if drained:
+                self._idle_ticks = 0
+                self._set_timer(context, TIMER_FAST)
+            else:
+                self._idle_ticks += 1
+                if self._idle_ticks >= TIMER_IDLE_TICKS:
+                    self._set_timer(context, TIMER_SLOW)
             t = perf_counter() - self.started
             self.report(
                 {"INFO"},
@@ -406,10 +514,10 @@ class VSE_OT_generate_narration(bpy.types.Operator):
         elif event.type in {"ESC"}:
             # Signal the background task to stop
             self.stop_event.set()
+            # A task still queued behind others on the shared pool never starts
+            self.future.cancel()
 
-            # Clean up timer immediately
-            if hasattr(self, "_timer") and self._timer:
-                context.window_manager.event_timer_remove(self._timer)
+            # Keep the timer running: the next TIMER event does the cleanup
 
             # Immediate feedback to user that cancellation is requested
             self.report({"WARNING"}, "Cancelling narration generation...")
@@ -425,6 +533,26 @@ class VSE_OT_generate_narration(bpy.types.Operator):
         # Continue running modally, waiting for TIMER or ESC
         return {"PASS_THROUGH"}  # Let other events pass through
 
+    def _set_timer(self, context, interval):
+        # Replace the modal timer only when the interval actually changes
+        # (tracked here; Timer.time_step is a single-precision float)
+        if self._timer and self._timer_interval == interval:
+            return
+        wm = context.window_manager
+        if self._timer:
+            wm.event_timer_remove(self._timer)
+        self._timer = wm.event_timer_add(interval, window=context.window)
+        self._timer_interval = interval
+
+    def cancel(self, context):
+        # Called by Blender when the modal operator is aborted from outside
+        # (e.g. a new file is loaded); stop the worker and release the timer
+        self.stop_event.set()
+        self.future.cancel()
+        if getattr(self, "_timer", None):
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+
     # Optional: execute method if called without invoke (e.g., from script)
     def execute(self, context):
         # Fallback or direct execution - might block if not handled carefully
@@ -1,9 +1,14 @@
 import abc
+from concurrent.futures import ThreadPoolExecutor
 
 
 class SynthesizerBase(abc.ABC):
     """Abstract base class for TTS handlers."""
 
+    # How many synthesize() calls synthesize_batch may run at once.
+    # Handlers whose engine is not reentrant keep the default of 1.
+    max_concurrency = 1
+
     @abc.abstractmethod
     def synthesize(self, text: str, output_path: str, **kwargs) -> None:
         """
@@ -21,6 +26,40 @@ class SynthesizerBase(abc.ABC):
         """Check if the handler's dependencies are installed."""
         return True
 
+    def synthesize_batch(self, items: list):
+        """
+        Synthesize several texts, yielding as each one completes.
+
+        Up to 'max_concurrency' items are synthesized on worker threads.
+        Handlers that can amortize engine start-up across items override this.
+
+        Args:
+            items: A list of (text, output_path) pairs.
+
+        Yields:
+            (index, error) tuples in item order; error is None on success.
+        """
+        if len(items) < 2 or self.max_concurrency < 2:
+            for i, (text, output_path) in enumerate(items):
+                try:
+                    self.synthesize(text, output_path)
+                except Exception as e:
+                    yield i, e
+                else:
+                    yield i, None
+            return
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(items)),
+            thread_name_prefix="VocalVSE_synth",
+        )
+        try:
+            futures = [pool.submit(self.synthesize, text, path) for text, path in items]
+            for i, future in enumerate(futures):
+                yield i, future.exception()
+        finally:
+            # Drop queued items if the caller stopped early
+            pool.shutdown(cancel_futures=True)
+
     def __getattr__(self, name):
         f = not name.startswith("_get_") and getattr(self, f"_get_{name}", None)
         if f:
@@ -2,6 +2,7 @@ import os
 import subprocess
 from logging import getLogger
 from . import SynthesizerBase
+from ..core.file_manager import ensure_dir
 
 logger = getLogger(__name__)
 
@@ -29,8 +30,14 @@ class Synthesizer(SynthesizerBase):
                                 Defaults to False. Use with caution.
         encoding (str, optional): The text encoding to use for the input sent to stdin.
                                   Defaults to 'utf-8'.
+
+    Batches run one command at a time, since local engines can be heavy. Set
+    max_concurrency on the voice profile in voices.toml to run more at once.
     """
 
+    # Resolved executable path per command name, shared by all instances
+    _which_cache = {}
+
     def __init__(
         self, bin="", args=None, shell=False, cwd="", encoding="utf-8", **kwargs
     ):
@@ -86,7 +93,7 @@ class Synthesizer(SynthesizerBase):
             # Ensure the output directory exists
             output_dir = os.path.dirname(output_path)
             if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
+                ensure_dir(output_dir)
 
             # Use Popen for more control over stdin
             with subprocess.Popen(
@@ -131,6 +138,44 @@ class Synthesizer(SynthesizerBase):
             )
             raise RuntimeError(f"Command execution failed: {e}") from e
 
+    def synthesize_to_stream(self, text: str) -> bytes:
+        """
+        Synthesizes text and returns the audio the command writes to stdout.
+
+        The output path given to the command is '-', so the configured tool must
+        treat it as stdout (e.g. gtts-cli ["--output", "{output_path}", "-"]).
+        No temporary file is written.
+
+        Args:
+            text: The text to synthesize.
+        """
+        cmd = self._prepare_command("-")
+        logger.info(
+            f"Executing TTS command: {' '.join(cmd) if not self.shell else cmd}"
+        )
+        try:
+            process = subprocess.run(
+                cmd,
+                input=text.encode(self.encoding),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                shell=self.shell,
+                cwd=self.cwd,
+            )
+        except FileNotFoundError:
+            error_msg = f"The executable '{self.bin}' was not found. Please check the 'bin' path."
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from None
+        if process.returncode != 0:
+            stderr = process.stderr.decode(self.encoding, "replace")
+            error_msg = (
+                f"Command '{' '.join(cmd)}' failed with return code {process.returncode}.\n"
+                f"Stderr: {stderr}"
+            )
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        return process.stdout
+
     def is_available(self) -> bool:
         """
         Checks if the configured executable exists and is accessible.
@@ -148,7 +193,12 @@ class Synthesizer(SynthesizerBase):
             return is_executable
         else:
             # If it's not absolute, treat it like a command name and search PATH
-            found_path = self.shutil.which(self.bin)
+            found_path = self._which_cache.get(self.bin)
+            if found_path is None:
+                found_path = self.shutil.which(self.bin)
+                # Misses are not cached, so a tool installed later is found
+                if found_path is not None:
+                    self._which_cache[self.bin] = found_path
             is_found = found_path is not None
             logger.debug(
                 f"is_available (command): {self.bin} -> {is_found} ({found_path})"
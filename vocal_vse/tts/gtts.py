@@ -2,6 +2,10 @@ from . import SynthesizerBase
 
 
 class Synthesizer(SynthesizerBase):
+    # Each item is an independent HTTP request, but parallel requests to the
+    # translate endpoint soon get HTTP 429; profiles can raise this in voices.toml
+    max_concurrency = 1
+
     def __init__(self, lang="en", tld="com", slow=False, timeout=0, **kwargs):
         self.lang = lang
         self.tld = tld
@@ -1,5 +1,11 @@
+from weakref import WeakKeyDictionary
 from . import SynthesizerBase
 
+# pyttsx3.init() returns the same engine for every Synthesizer, so settings are
+# applied before each run, and only the ones that differ from the last run
+_engine_defaults = WeakKeyDictionary()
+_engine_applied = WeakKeyDictionary()
+
 
 class Synthesizer(SynthesizerBase):
     def __init__(self, voice_id="", rate=-1, volume=-1.0, **kwargs):
@@ -12,17 +18,49 @@ class Synthesizer(SynthesizerBase):
             self.engine = pyttsx3.init()
 
     def synthesize(self, text: str, output_path: str):
+        self._apply_properties()
         self.engine.save_to_file(text, output_path)
         self.engine.runAndWait()  # Important: Waits for file to be written
 
+    def synthesize_batch(self, items: list):
+        """Queue every item on the engine, then run the driver loop once."""
+        if not items:
+            return
+        engine = self.engine
+        self._apply_properties()
+        for text, output_path in items:
+            engine.save_to_file(text, output_path)
+        try:
+            engine.runAndWait()
+        except Exception as e:
+            error = e
+        else:
+            error = None
+        for i in range(len(items)):
+            yield i, error
+
     def is_available(self):
         return self.engine is not None
 
+    def _apply_properties(self):
+        engine = self.engine
+        defaults = _engine_defaults.get(engine)
+        if defaults is None:
+            defaults = {k: engine.getProperty(k) for k in ("rate", "volume", "voice")}
+            _engine_defaults[engine] = defaults
+            _engine_applied[engine] = dict(defaults)
+        applied = _engine_applied[engine]
+        wanted = {
+            "rate": self.rate if self.rate >= 0 else defaults["rate"],
+            "volume": self.volume if self.volume >= 0 else defaults["volume"],
+            "voice": self.voice_id or defaults["voice"],
+        }
+        for name, value in wanted.items():
+            if applied.get(name) != value:
+                engine.setProperty(name, value)
+                applied[name] = value
+
     def _get_engine(self):
         import pyttsx3
 
-        engine = pyttsx3.init()
-        self.rate >= 0 and engine.setProperty("rate", self.rate)
-        self.volume >= 0 and engine.setProperty("volume", self.volume)
-        self.voice_id and engine.setProperty("voice", self.voice_id)
-        return engine
+        return pyttsx3.init()
@@ -1,6 +1,6 @@
 import os
 import bpy
-from ..core import config as config
+from ..core import config as config, file_manager
 
 
 class SEQUENCER_PT_tts_panel(bpy.types.Panel):
@@ -57,7 +57,16 @@ class SEQUENCER_PT_tts_panel(bpy.types.Panel):
             "vocal_vse.reload_voices_config", text="Reload Voices", icon="FILE_REFRESH"
         )
         # --- Other Tools (conditional on selected text with tts_id) ---
-        if any(s.type == "TEXT" and "tts_id" in s for s in selected_sequences):
+        # Check the active strip first so the common case skips the scan
+        active = context.active_sequence_strip
+        if (
+            active
+            and active.select
+            and active.type == "TEXT"
+            and file_manager.ID_PROP in active
+        ) or any(
+            s.type == "TEXT" and file_manager.ID_PROP in s for s in selected_sequences
+        ):
             layout.separator()  # Add visual separation
             col = layout.column(align=True)
             col.operator(
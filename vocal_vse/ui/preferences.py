@@ -11,14 +11,13 @@ class VocalVSEPreferences(bpy.types.AddonPreferences):
 
     def draw(self, context):
         layout = self.layout
+        output_dir = config.default_output_dir  # Resolve once per draw
         # Inform the user about the default output location
         layout.label(
-            text=f"Audio files are saved to: {config.default_output_dir}",
+            text=f"Audio files are saved to: {output_dir}",
             icon="INFO",  # Add an icon for better visibility
         )
-        layout.operator("wm.path_open", text="Open Save Folder").filepath = (
-            config.default_output_dir
-        )
+        layout.operator("wm.path_open", text="Open Save Folder").filepath = output_dir
         layout.operator("wm.path_open", text="Open Config Folder").filepath = (
             config.config_dir
         )